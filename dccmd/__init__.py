@@ -8,10 +8,18 @@ __version__ = "0.4.3"
 
 # std imports
 import sys
-import os
 import asyncio
+from contextlib import asynccontextmanager
+
+# use libuv based event loop if available (not on Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
 
 # external imports
+from dracoon.nodes import CHUNK_SIZE
 from dracoon.nodes.models import NodeType
 from dracoon.errors import (
     DRACOONHttpError,
@@ -27,19 +35,23 @@ import typer
 
 # internal imports
 from dccmd.main.util import (
-    graceful_exit,
+    handle_dracoon_errors,
     parse_file_name,
     parse_path,
     parse_new_path,
     format_error_message,
     format_success_message,
-    format_and_print_node,
+    format_and_print_node_dict,
     to_readable_size,
+    get_nodes_raw,
+    list_nodes_by_path,
+    can_list_by_path,
 )
 from dccmd.main.auth import auth_app
 from dccmd.main.auth.client import client_app
-from dccmd.main.auth.util import init_dracoon
+from dccmd.main.auth.util import init_dracoon, release_session
 from dccmd.main.auth.credentials import (
+    get_credentials,
     get_crypto_credentials,
     delete_credentials
 )
@@ -48,9 +60,15 @@ from dccmd.main.crypto import crypto_app
 from dccmd.main.users import users_app
 from dccmd.main.rooms import rooms_app
 from dccmd.main.users.manage import find_user_by_username
-from dccmd.main.crypto.keys import distribute_missing_keys
+from dccmd.main.crypto.keys import distribute_missing_keys, drain_missing_keys
 from dccmd.main.crypto.util import init_keypair
-from dccmd.main.upload import create_folder_struct, bulk_upload, is_directory, is_file
+from dccmd.main.upload import (
+    create_folder_struct,
+    bulk_upload,
+    get_upload_concurrency,
+    classify,
+    get_chunk_size,
+)
 from dccmd.main.download import create_download_list, bulk_download
 from dccmd.main.models import DCTransfer, DCTransferList
 from dccmd.main.models.errors import (DCPathParseError, ConnectError)
@@ -64,6 +82,35 @@ app.add_typer(typer_instance=users_app, name="users", help="Manage users")
 app.add_typer(typer_instance=rooms_app, name="rooms", help="Manage room permissions")
 
 
+@asynccontextmanager
+async def _with_session(
+    url_str: str, username: str, password: str, cli_mode: bool, debug: bool
+):
+    """get authenticated DRACOON instance - access token is cached for reuse on exit"""
+    dracoon, base_url = await init_dracoon(
+        url_str=url_str,
+        username=username,
+        password=password,
+        cli_mode=cli_mode,
+        debug=debug,
+    )
+
+    invalidate = False
+
+    try:
+        yield dracoon, base_url
+    except HTTPUnauthorizedError:
+        # tokens no longer valid - remove stored credentials
+        invalidate = True
+        if get_credentials(base_url):
+            delete_credentials(base_url=base_url)
+        raise
+    finally:
+        await release_session(
+            dracoon=dracoon, base_url=base_url, cli_mode=cli_mode, invalidate=invalidate
+        )
+
+
 @app.command()
 def upload(
     source_dir_path: str = typer.Argument(
@@ -92,7 +139,7 @@ def upload(
         2,
         "--velocity",
         "-v",
-        help="Concurrent requests factor (1: slow, 2: normal, 3: fast)",
+        help="Concurrent uploads factor (1: slow / 4, 2: normal / 16, 3: fast / 64)",
     ),
     username: str = typer.Argument(
         None, help="Username to log in to DRACOON - only works with active cli mode"
@@ -103,146 +150,142 @@ def upload(
 ):
     """Upload a file or folder into DRACOON """
 
+    @handle_dracoon_errors(
+        errors={
+            HTTPForbiddenError: ("Insufficient permissions (create required).", 1),
+            HTTPConflictError: ("File already exists.", 1),
+            InvalidPathError: (f"Target path not found. ({target_path})", 1),
+            DRACOONHttpError: ("An error ocurred uploading the file.", 1),
+        }
+    )
     async def _upload():
 
         # get authenticated DRACOON instance
-        dracoon, base_url = await init_dracoon(
+        async with _with_session(
             url_str=target_path,
             username=username,
             password=password,
             cli_mode=cli_mode,
             debug=debug,
-        )
+        ) as (dracoon, base_url):
 
-        # remove base url from path
-        parsed_path = parse_path(target_path)
-        dracoon.logger.debug(parsed_path)
-        node_info = await dracoon.nodes.get_node_from_path(path=parsed_path)
+            # remove base url from path
+            parsed_path = parse_path(target_path)
+            dracoon.logger.debug(parsed_path)
+            node_info = await dracoon.nodes.get_node_from_path(path=parsed_path)
 
-        if node_info is None:
-            await dracoon.logout()
-            typer.echo(format_error_message(msg=f"Invalid target path: {target_path}"))
-            sys.exit(1)
+            if node_info is None:
+                typer.echo(format_error_message(msg=f"Invalid target path: {target_path}"))
+                sys.exit(1)
 
-        if node_info.isEncrypted is True:
-            crypto_secret = get_crypto_credentials(base_url)
-            await init_keypair(
-                dracoon=dracoon, base_url=base_url, crypto_secret=crypto_secret
-            )
+            if node_info.isEncrypted is True:
+                crypto_secret = get_crypto_credentials(base_url)
+                await init_keypair(
+                    dracoon=dracoon, base_url=base_url, crypto_secret=crypto_secret
+                )
 
-        is_folder = is_directory(folder_path=source_dir_path)
-        is_file_path = is_file(folder_path=source_dir_path)
+            source_type, source_size = classify(source_dir_path)
+            is_folder = source_type == "dir"
+            is_file_path = source_type == "file"
 
-        resolution_strategy = "fail"
+            resolution_strategy = "fail"
 
-        if overwrite:
-            resolution_strategy = "overwrite"
+            if overwrite:
+                resolution_strategy = "overwrite"
 
-        if overwrite and auto_rename:
-            typer.echo(
-                format_error_message(
-                    msg="Conflict: cannot use both resolution strategies (auto-rename / overwrite)."
+            if overwrite and auto_rename:
+                typer.echo(
+                    format_error_message(
+                        msg="Conflict: cannot use both resolution strategies (auto-rename / overwrite)."
+                    )
                 )
-            )
-            sys.exit(1)
+                sys.exit(1)
+
+            if auto_rename:
+                resolution_strategy = "autorename"
 
-        if auto_rename:
-            resolution_strategy = "autorename"
+            # node id must be from parent room if folder
+            if node_info.type == NodeType.folder:
+                distrib_node_id = node_info.authParentId
+            elif node_info.type == NodeType.room:
+                distrib_node_id = node_info.id
+            else:
+                distrib_node_id = None
 
-        # uploading a folder must be used with -r flag
-        if is_folder and not recursive:
-            typer.echo(
-                format_error_message(
-                    msg="Folder can only be uploaded via recursive (-r) flag."
+            distribute_keys = node_info.isEncrypted is True and distrib_node_id is not None
+
+            # uploading a folder must be used with -r flag
+            if is_folder and not recursive:
+                typer.echo(
+                    format_error_message(
+                        msg="Folder can only be uploaded via recursive (-r) flag."
+                    )
+                )
+            # upload a folder and all related content
+            elif is_folder and recursive:
+                await create_folder_struct(
+                    source=source_dir_path, target=parsed_path, dracoon=dracoon,
+                    velocity=velocity
                 )
-            )
-        # upload a folder and all related content
-        elif is_folder and recursive:
-            await create_folder_struct(
-                source=source_dir_path, target=parsed_path, dracoon=dracoon,
-                velocity=velocity
-            )
-            await bulk_upload(
-                source=source_dir_path,
-                target=parsed_path,
-                dracoon=dracoon,
-                resolution_strategy=resolution_strategy,
-                velocity=velocity,
-            )
-            try:
-                folder_name = parse_file_name(full_path=source_dir_path)
-            except DCPathParseError:
-                folder_name = source_dir_path
-            typer.echo(f'{format_success_message(f"Folder {folder_name} uploaded.")}')
-        # upload a single file
-        elif is_file_path:
-            file_size = os.path.getsize(source_dir_path)
-            transfer_list = DCTransferList(total=file_size, file_count=1)
-            transfer = DCTransfer(transfer=transfer_list)
-            try:
+                concurrency = get_upload_concurrency(velocity=velocity)
+
+                # distribute keys in the background while files are uploaded
+                key_queue = asyncio.Queue()
+                key_task = None
+                if distribute_keys:
+                    key_task = asyncio.create_task(
+                        drain_missing_keys(dracoon=dracoon, queue=key_queue, room_id=distrib_node_id)
+                    )
+
+                await bulk_upload(
+                    source=source_dir_path,
+                    target=parsed_path,
+                    dracoon=dracoon,
+                    resolution_strategy=resolution_strategy,
+                    velocity=velocity,
+                    sem=asyncio.Semaphore(concurrency),
+                    on_file_uploaded=key_queue.put_nowait if key_task is not None else None,
+                )
+
+                if key_task is not None:
+                    key_queue.put_nowait(None)
+                    await key_task
+
+                try:
+                    folder_name = parse_file_name(full_path=source_dir_path)
+                except DCPathParseError:
+                    folder_name = source_dir_path
+                typer.echo(f'{format_success_message(f"Folder {folder_name} uploaded.")}')
+            # upload a single file
+            elif is_file_path:
+                transfer_list = DCTransferList(total=source_size, file_count=1)
+                transfer = DCTransfer(transfer=transfer_list)
                 await dracoon.upload(
                     file_path=source_dir_path,
                     target_path=parsed_path,
                     resolution_strategy=resolution_strategy,
                     callback_fn=transfer.update,
                     raise_on_err=True,
+                    # library default chunk size - raised for files above the S3 part limit
+                    chunksize=get_chunk_size(source_size, chunk_size=CHUNK_SIZE),
                 )
-            except HTTPUnauthorizedError:
-                await graceful_exit(dracoon=dracoon)
-                delete_credentials(base_url=base_url)
-                format_error_message(
-                        msg="Re-authentication required - please run operation again with new login."
-                )
-                sys.exit(1)
-            except HTTPForbiddenError:
-                await dracoon.logout()
-                typer.echo(
-                    format_error_message(
-                        msg="Insufficient permissions (create required)."
-                    )
-                )
-                sys.exit(1)
-            except HTTPConflictError:
-                await dracoon.logout()
-                typer.echo(format_error_message(msg="File already exists."))
-                sys.exit(1)
-            except InvalidPathError:
-                await dracoon.logout()
-                typer.echo(
-                    format_error_message(msg=f"Target path not found. ({target_path})")
-                )
-                sys.exit(1)
-            except DRACOONHttpError:
-                await dracoon.logout()
-                typer.echo(
-                    format_error_message(msg="An error ocurred uploading the file.")
-                )
-                sys.exit(1)
 
-            try:
-                file_name = parse_file_name(full_path=source_dir_path)
-            except DCPathParseError:
-                file_name = source_dir_path
+                if distribute_keys:
+                    await distribute_missing_keys(dracoon=dracoon, room_id=distrib_node_id)
 
-            typer.echo(f'{format_success_message(f"File {file_name} uploaded.")}')
-        # handle invalid path
-        else:
-            typer.echo(
-            format_error_message(msg=f"Provided path must be a folder or file. ({source_dir_path})")
-            )
+                try:
+                    file_name = parse_file_name(full_path=source_dir_path)
+                except DCPathParseError:
+                    file_name = source_dir_path
 
-        # node id must be from parent room if folder
-        if node_info.type == NodeType.folder:
-            distrib_node_id = node_info.authParentId
-        if node_info.type == NodeType.room:
-            distrib_node_id = node_info.id
-        else:
-            distrib_node_id = None
+                typer.echo(f'{format_success_message(f"File {file_name} uploaded.")}')
+            # handle invalid path
+            else:
+                typer.echo(
+                format_error_message(msg=f"Provided path must be a folder or file. ({source_dir_path})")
+                )
 
-        if node_info.isEncrypted is True and distrib_node_id is not None:
-            await distribute_missing_keys(dracoon=dracoon, room_id=distrib_node_id)
 
-        await dracoon.logout()
 
     asyncio.run(_upload())
 
@@ -268,63 +311,40 @@ def mkdir(
 ):
     """Create a folder in a DRACOON parent path"""
 
+    @handle_dracoon_errors(
+        errors={
+            HTTPConflictError: (f"Name already exists: {dir_path}", 1),
+            HTTPForbiddenError: ("Insufficient permissions (create permission required).", 1),
+            DRACOONHttpError: ("An error ocurred - folder could not be created.", 1),
+        }
+    )
     async def _create_folder():
 
         # get authenticated DRACOON instance
-        dracoon, base_url = await init_dracoon(
+        async with _with_session(
             url_str=dir_path,
             username=username,
             password=password,
             cli_mode=cli_mode,
             debug=debug,
-        )
+        ) as (dracoon, _):
 
-        # remove base url from path
-        parsed_path = parse_new_path(full_path=dir_path)
+            # remove base url from path
+            parsed_path = parse_new_path(full_path=dir_path)
 
-        folder_name = parse_file_name(full_path=dir_path)
+            folder_name = parse_file_name(full_path=dir_path)
 
-        parent_node = await dracoon.nodes.get_node_from_path(path=parsed_path)
+            parent_node = await dracoon.nodes.get_node_from_path(path=parsed_path)
 
-        if parent_node is None:
-            await dracoon.logout()
-            typer.echo(format_error_message(msg=f"Node not found: {parsed_path}"))
-            sys.exit(1)
+            if parent_node is None:
+                typer.echo(format_error_message(msg=f"Node not found: {parsed_path}"))
+                sys.exit(1)
 
-        payload = dracoon.nodes.make_folder(name=folder_name, parent_id=parent_node.id)
+            payload = dracoon.nodes.make_folder(name=folder_name, parent_id=parent_node.id)
 
-        try:
             await dracoon.nodes.create_folder(folder=payload, raise_on_err=True)
-        except HTTPUnauthorizedError:
-            await graceful_exit(dracoon=dracoon)
-            delete_credentials(base_url=base_url)
-            format_error_message(
-                        msg="Re-authentication required - please run operation again with new login."
-                )
-            sys.exit(1)
-        except HTTPConflictError:
-            await dracoon.logout()
-            typer.echo(format_error_message(msg=f"Name already exists: {dir_path}"))
-            sys.exit(1)
-        except HTTPForbiddenError:
-            await dracoon.logout()
-            typer.echo(
-                format_error_message(
-                    msg="Insufficient permissions (create permission required)."
-                )
-            )
-            sys.exit(1)
-        except DRACOONHttpError:
-            await dracoon.logout()
-            typer.echo(
-                format_error_message(
-                    msg="An error ocurred - folder could not be created."
-                )
-            )
-            sys.exit(1)
 
-        typer.echo(format_success_message(msg=f"Folder {folder_name} created."))
-        await dracoon.logout()
+            typer.echo(format_success_message(msg=f"Folder {folder_name} created."))
 
     asyncio.run(_create_folder())
 
@@ -356,104 +376,67 @@ def mkroom(
 ):
     """Create a room (inherit permissions) in a DRACOON parent path"""
 
+    @handle_dracoon_errors(
+        errors={
+            HTTPConflictError: (f"Name already exists: {dir_path}", 1),
+            HTTPForbiddenError: ("Insufficient permissions (room admin required).", 1),
+            DRACOONHttpError: ("An error ocurred - room could not be created.", 1),
+            TimeoutError: ("Connection timeout - room could not be created.", 1),
+            ConnectError: ("Connection error - room could not be created.", 1),
+        }
+    )
     async def _create_room():
 
         # get authenticated DRACOON instance
-        dracoon, base_url = await init_dracoon(
+        async with _with_session(
             url_str=dir_path,
             username=username,
             password=password,
             cli_mode=cli_mode,
             debug=debug,
-        )
+        ) as (dracoon, _):
 
-        # remove base url from path
-        parsed_path = parse_new_path(full_path=dir_path)
+            # remove base url from path
+            parsed_path = parse_new_path(full_path=dir_path)
 
-        if parsed_path == "/":
-            parent_node = None
-            parent_id = 0
-        else:
-            parent_node = await dracoon.nodes.get_node_from_path(path=parsed_path)
-            parent_id = parent_node.id
-
-        room_name = parse_file_name(full_path=dir_path)
-
-        if parsed_path != "/" and parent_node is None:
-            await dracoon.logout()
-            typer.echo(format_error_message(msg=f"Node not found: {parsed_path}"))
-            sys.exit(1)
-        if parent_node and parent_node.type != NodeType.room:
-            await dracoon.logout()
-            typer.echo(
-                format_error_message(msg=f"Parent path must be a room: {parsed_path}")
-            )
-            sys.exit(1)
-
-        if not admin_user and parent_id == 0:
-            await dracoon.logout()
-            typer.echo(
-                format_error_message(msg="An admin user must be provided on root path.")
-            )
-            sys.exit(1)
-
-        if admin_user and parent_id != 0:
-            user_info = await find_user_by_username(dracoon=dracoon, user_name=admin_user, as_user_manager=False, room_id=parent_id)
-            payload = dracoon.nodes.make_room(name=room_name, parent_id=parent_id, inherit_perms=False, admin_ids=[user_info.userInfo.id]) # type: ignore
-        if admin_user and parent_id == 0:
-            user_info = await find_user_by_username(dracoon=dracoon, user_name=admin_user)
-            payload = dracoon.nodes.make_room(name=room_name, inherit_perms=False, admin_ids=[user_info.id], parent_id=None) # type: ignore
-        else:
-            payload = dracoon.nodes.make_room(
-            name=room_name, parent_id=parent_id, inherit_perms=True
-            )
-
-        try:
-            await dracoon.nodes.create_room(room=payload, raise_on_err=True)
-        except HTTPUnauthorizedError:
-            await graceful_exit(dracoon=dracoon)
-            delete_credentials(base_url=base_url)
-            format_error_message(
-                        msg="Re-authentication required - please run operation again with new login."
-                )
-            sys.exit(1)
-        except HTTPConflictError:
-            typer.echo(format_error_message(msg=f"Name already exists: {dir_path}"))
-            await dracoon.logout()
-            sys.exit(1)
-        except HTTPForbiddenError:
-            await dracoon.logout()
-            typer.echo(
-                format_error_message(
-                    msg="Insufficient permissions (room admin required)."
-                )
-            )
-            sys.exit(1)
-        except DRACOONHttpError:
-            await dracoon.logout()
-            typer.echo(
-                format_error_message(
-                    msg="An error ocurred - room could not be created."
+            if parsed_path == "/":
+                parent_node = None
+                parent_id = 0
+            else:
+                parent_node = await dracoon.nodes.get_node_from_path(path=parsed_path)
+                parent_id = parent_node.id
+
+            room_name = parse_file_name(full_path=dir_path)
+
+            if parsed_path != "/" and parent_node is None:
+                typer.echo(format_error_message(msg=f"Node not found: {parsed_path}"))
+                sys.exit(1)
+            if parent_node and parent_node.type != NodeType.room:
+                typer.echo(
+                    format_error_message(msg=f"Parent path must be a room: {parsed_path}")
                 )
-            )
-            sys.exit(1)
-        except TimeoutError:
-            typer.echo(
-                format_error_message(
-                    msg="Connection timeout - room could not be created."
+                sys.exit(1)
+
+            if not admin_user and parent_id == 0:
+                typer.echo(
+                    format_error_message(msg="An admin user must be provided on root path.")
                 )
-            )
-            sys.exit(1)
-        except ConnectError:
-            typer.echo(
-                format_error_message(
-                    msg="Connection error - room could not be created."
+                sys.exit(1)
+
+            if admin_user and parent_id != 0:
+                user_info = await find_user_by_username(dracoon=dracoon, user_name=admin_user, as_user_manager=False, room_id=parent_id)
+                payload = dracoon.nodes.make_room(name=room_name, parent_id=parent_id, inherit_perms=False, admin_ids=[user_info.userInfo.id]) # type: ignore
+            if admin_user and parent_id == 0:
+                user_info = await find_user_by_username(dracoon=dracoon, user_name=admin_user)
+                payload = dracoon.nodes.make_room(name=room_name, inherit_perms=False, admin_ids=[user_info.id], parent_id=None) # type: ignore
+            else:
+                payload = dracoon.nodes.make_room(
+                name=room_name, parent_id=parent_id, inherit_perms=True
                 )
-            )
-            sys.exit(1)
 
-        typer.echo(format_success_message(msg=f"Room {room_name} created."))
-        await dracoon.logout()
+            await dracoon.nodes.create_room(room=payload, raise_on_err=True)
+
+            typer.echo(format_success_message(msg=f"Room {room_name} created."))
 
     asyncio.run(_create_room())
 
@@ -483,85 +466,52 @@ def rm(
 ):
     """Delete a file / folder / room in DRACOON"""
 
+    @handle_dracoon_errors(
+        errors={
+            HTTPForbiddenError: ("Insufficient permissions (delete required).", 1),
+            DRACOONHttpError: ("An error ocurred - node could not be deleted.", 1),
+            TimeoutError: ("Connection timeout - node could not be deleted.", 1),
+            ConnectError: ("Connection error - node could not be deleted.", 1),
+        }
+    )
     async def _delete_node():
 
         # get authenticated DRACOON instance
-        dracoon, base_url = await init_dracoon(
+        async with _with_session(
             url_str=source_path,
             username=username,
             password=password,
             cli_mode=cli_mode,
             debug=debug,
-        )
+        ) as (dracoon, _):
 
-        # remove base url from path
-        parsed_path = parse_path(full_path=source_path)
+            # remove base url from path
+            parsed_path = parse_path(full_path=source_path)
 
-        node_name = parse_file_name(full_path=source_path)
+            node_name = parse_file_name(full_path=source_path)
 
-        node = await dracoon.nodes.get_node_from_path(path=parsed_path)
+            node = await dracoon.nodes.get_node_from_path(path=parsed_path)
 
-        if node is None:
-            await dracoon.logout()
-            typer.echo(format_error_message(msg=f"Node not found: {parsed_path}"))
-            sys.exit(1)
-        if node.type == NodeType.room and not recursive:
-            await dracoon.logout()
-            typer.echo(
-                format_error_message(
-                    msg="Room can only be deleted with recursive flag (-r)."
+            if node is None:
+                typer.echo(format_error_message(msg=f"Node not found: {parsed_path}"))
+                sys.exit(1)
+            if node.type == NodeType.room and not recursive:
+                typer.echo(
+                    format_error_message(
+                        msg="Room can only be deleted with recursive flag (-r)."
+                    )
                 )
-            )
-            sys.exit(1)
-        if node.type == NodeType.folder and not recursive:
-            await dracoon.logout()
-            typer.echo(
-                format_error_message(
-                    msg="Folder can only be deleted with recursive flag (-r)."
+                sys.exit(1)
+            if node.type == NodeType.folder and not recursive:
+                typer.echo(
+                    format_error_message(
+                        msg="Folder can only be deleted with recursive flag (-r)."
+                    )
                 )
-            )
-            sys.exit(1)
-        try:
+                sys.exit(1)
             await dracoon.nodes.delete_node(node_id=node.id, raise_on_err=True)
-        except HTTPUnauthorizedError:
-            await graceful_exit(dracoon=dracoon)
-            delete_credentials(base_url=base_url)
-            format_error_message(
-                        msg="Re-authentication required - please run operation again with new login."
-                )
-            sys.exit(1)
-        except HTTPForbiddenError:
-            await dracoon.logout()
-            typer.echo(
-                format_error_message(msg="Insufficient permissions (delete required).")
-            )
-            sys.exit(1)
-        except DRACOONHttpError:
-            await dracoon.logout()
-            typer.echo(
-                format_error_message(
-                    msg="An error ocurred - node could not be deleted."
-                )
-            )
-            sys.exit(1)
-        except TimeoutError:
-            typer.echo(
-                format_error_message(
-                    msg="Connection timeout - room could not be created."
-                )
-            )
-            sys.exit(1)
-        except ConnectError:
-            typer.echo(
-                format_error_message(
-                    msg="Connection error - room could not be created."
-                )
-            )
-            sys.exit(1)
 
-
-        typer.echo(format_success_message(msg=f"Node {node_name} deleted."))
-        await dracoon.logout()
+            typer.echo(format_success_message(msg=f"Node {node_name} deleted."))
 
     asyncio.run(_delete_node())
 
@@ -587,7 +537,7 @@ def ls(
         False, help="When active, sets log level to DEBUG and streams log"
     ),
     all_items: bool = typer.Option(
-        False, help="When active, returns all items without prompt"
+        False, "--all-items", "--all", "-a", help="When active, returns all items without prompt"
     ),
     room_manager: bool = typer.Option(
         False, help="When active, returns all nodes as room admin / manager"
@@ -601,144 +551,136 @@ def ls(
 ):
     """List all nodes in a DRACOON path"""
 
+    @handle_dracoon_errors(
+        errors={
+            HTTPForbiddenError: ("Insufficient permissions (delete required).", 1),
+            DRACOONHttpError: ("Error listing nodes.", 1),
+            TimeoutError: ("Connection timeout - could not list nodes.", 1),
+            ConnectError: ("Connection error - could not list nodes.", 1),
+        }
+    )
     async def _list_nodes():
 
         # get authenticated DRACOON instance
-        dracoon, base_url = await init_dracoon(
+        async with _with_session(
             url_str=source_path,
             username=username,
             password=password,
             cli_mode=cli_mode,
             debug=debug,
-        )
+        ) as (dracoon, _):
 
-        # remove base url from path
-        parsed_path = parse_path(full_path=source_path)
-      
-        if parsed_path == "/":
-            parent_node = None
-            parent_id = 0
-        else:
-            parent_node = await dracoon.nodes.get_node_from_path(path=parsed_path)
-            parent_id = parent_node.id
-
-        if parent_node is None and parsed_path != "/":
-            await dracoon.logout()
-            typer.echo(format_error_message(msg=f"Node not found: {parsed_path}"))
-            sys.exit(1)
-        if parent_node and parent_node.type == NodeType.file:
-            await dracoon.logout()
-            typer.echo(
-                format_error_message(
-                    msg=f"Path must be a room or a folder ({source_path})"
-                )
-            )
-            sys.exit(1)
-        try:
-            nodes = await dracoon.nodes.get_nodes(parent_id=parent_id, room_manager=room_manager, raise_on_err=True)
-        except HTTPUnauthorizedError:
-            await graceful_exit(dracoon=dracoon)
-            delete_credentials(base_url=base_url)
-            format_error_message(
-                        msg="Re-authentication required - please run operation again with new login."
-                )
-            sys.exit(1)
-        except HTTPForbiddenError:
-            await dracoon.logout()
-            typer.echo(
-                format_error_message(msg="Insufficient permissions (delete required).")
-            )
-            sys.exit(1)
-        except DRACOONHttpError:
-            await dracoon.logout()
-            typer.echo(format_error_message(msg="Error listing nodes."))
-            sys.exit(1)
-        except TimeoutError:
-            typer.echo(
-                format_error_message(
-                    msg="Connection timeout - could not list nodes."
-                )
-            )
-            sys.exit(1)
-        except ConnectError:
-            typer.echo(
-                format_error_message(
-                    msg="Connection error - could not list nodes."
-                )
-            )
-            sys.exit(1)
-
-        # handle more than 500 items
-        if nodes.range.total > 500:
-            if not all_items:
-                show_all = typer.confirm(
-                f"More than 500 nodes in {parsed_path} - display all?"
-            )
-            else:
-                show_all = all_items
+            # remove base url from path
+            parsed_path = parse_path(full_path=source_path)
 
-            if not show_all:
-                typer.echo(f"{nodes.range.total} nodes – only 500 displayed.")
-                raise typer.Abort()
+            # list via path search - room manager listing requires parent id,
+            # paths with filter characters (":", "|") are listed by parent id
+            list_by_path = parsed_path != "/" and not room_manager and can_list_by_path(parsed_path)
 
-            for offset in range(500, nodes.range.total, 500):
-                try:
-                    nodes_res = await dracoon.nodes.get_nodes(
-                        parent_id=parent_id, offset=offset, room_manager=room_manager, raise_on_err=True
-                    )
-                    nodes.items.extend(nodes_res.items)
-                except HTTPUnauthorizedError:
-                    await graceful_exit(dracoon=dracoon)
-                    delete_credentials(base_url=base_url)
-                    format_error_message(
-                            msg="Re-authentication required - please run operation again with new login."
-                    )
+            # root path: no parent node to resolve
+            if parsed_path == "/":
+                parent_node = None
+                parent_id = 0
+                nodes = await get_nodes_raw(dracoon=dracoon, room_manager=room_manager)
+            else:
+                # path search runs concurrently with resolving the parent node
+                listing = (
+                    asyncio.ensure_future(list_nodes_by_path(dracoon=dracoon, path=parsed_path))
+                    if list_by_path
+                    else None
+                )
+                parent_node = await dracoon.nodes.get_node_from_path(path=parsed_path)
+
+                if parent_node is None:
+                    typer.echo(format_error_message(msg=f"Node not found: {parsed_path}"))
                     sys.exit(1)
-                except HTTPForbiddenError:
-                    await dracoon.logout()
+                if parent_node.type == NodeType.file:
                     typer.echo(
                         format_error_message(
-                            msg="Insufficient permissions (delete required)."
+                            msg=f"Path must be a room or a folder ({source_path})"
                         )
                     )
                     sys.exit(1)
-                except DRACOONHttpError:
-                    await dracoon.logout()
-                    typer.echo(format_error_message(msg="Error listing nodes."))
-                    sys.exit(1)
-                except TimeoutError:
-                    typer.echo(
-                        format_error_message(
-                            msg="Connection timeout - could not list nodes."
-                        )
+
+                parent_id = parent_node.id
+
+                if list_by_path:
+                    nodes = await listing
+                else:
+                    nodes = await get_nodes_raw(
+                        dracoon=dracoon, parent_id=parent_id, room_manager=room_manager
                     )
-                    sys.exit(1)
-                except ConnectError:
-                    typer.echo(
-                        format_error_message(
-                            msg="Connection error - could not list nodes."
+
+            # nodes are decoded JSON (no model validation for display)
+            total = nodes["range"]["total"]
+            offsets = list(range(500, total, 500))
+            # fetch up to 8 pages concurrently
+            sem = asyncio.Semaphore(8)
+
+            async def fetch(offset: int):
+                async with sem:
+                    if list_by_path:
+                        nodes_res = await list_nodes_by_path(
+                            dracoon=dracoon, path=parsed_path, offset=offset
+                        )
+                    else:
+                        nodes_res = await get_nodes_raw(
+                            dracoon=dracoon, parent_id=parent_id, offset=offset, room_manager=room_manager
                         )
+                return offset, nodes_res
+
+            # prefetch remaining pages (overlaps with prompt below)
+            prefetch = [asyncio.ensure_future(fetch(offset)) for offset in offsets]
+
+            # handle more than 500 items
+            if total > 500:
+                if not all_items:
+                    # prompt in a thread to keep the event loop fetching
+                    show_all = await asyncio.to_thread(
+                        typer.confirm, f"More than 500 nodes in {parsed_path} - display all?"
+                    )
+                else:
+                    show_all = all_items
+
+                if not show_all:
+                    for page in prefetch:
+                        page.cancel()
+                    typer.echo(f"{total} nodes – only 500 displayed.")
+                    raise typer.Abort()
+
+            # total size of parent (root has no parent node)
+            if long_list and parent_node is not None:
+                size = parent_node.size or 0
+                typer.echo(f"total {to_readable_size(size) if human_readable else size}")
+
+            def print_nodes(items):
+                """print a page of nodes"""
+                for node in items:
+                    format_and_print_node_dict(
+                        node=node,
+                        inode=inode,
+                        long_list=long_list,
+                        readable_size=human_readable,
                     )
-                    sys.exit(1)
 
-        if long_list and parent_node is not None and human_readable:
-            if parent_node.size:
-                size = parent_node.size
-            else:
-                size = 0
-            typer.echo(f"total {to_readable_size(size)}")
-        elif long_list and parent_node is not None:
-            typer.echo(f"total {parent_node.size}")
+            print_nodes(nodes["items"])
+
+            if total <= 500:
+                return
 
-        for node in nodes.items:
-            format_and_print_node(
-                node=node,
-                inode=inode,
-                long_list=long_list,
-                readable_size=human_readable,
-            )
+            async def iter_pages():
+                """yield pages in offset order as they arrive (out of order pages are buffered)"""
+                pending = {}
+                next_offset = offsets[0]
+                for page in asyncio.as_completed(prefetch):
+                    offset, nodes_res = await page
+                    pending[offset] = nodes_res
+                    while next_offset in pending:
+                        yield pending.pop(next_offset)
+                        next_offset += 500
 
-        await dracoon.logout()
+            async for nodes_res in iter_pages():
+                print_nodes(nodes_res["items"])
 
     asyncio.run(_list_nodes())
 
@@ -777,160 +719,133 @@ def download(
     Download a file, folder or room from DRACOON 
     """
 
+    @handle_dracoon_errors(
+        errors={
+            DRACOONHttpError: ("Error downloading file.", 1),
+        }
+    )
     async def _download():
 
         # get authenticated DRACOON instance
-        dracoon, base_url = await init_dracoon(
+        async with _with_session(
             url_str=source_path,
             username=username,
             password=password,
             cli_mode=cli_mode,
             debug=debug,
-        )
+        ) as (dracoon, base_url):
 
-        # remove base url from path
-        parsed_path = parse_path(full_path=source_path)
+            # remove base url from path
+            parsed_path = parse_path(full_path=source_path)
 
-        file_name = parse_file_name(full_path=source_path)
+            file_name = parse_file_name(full_path=source_path)
 
-        node_info = await dracoon.nodes.get_node_from_path(path=parsed_path)
-
-        if not node_info:
-            await dracoon.logout()
-            typer.echo(format_error_message(msg=f"Node not found ({parsed_path})."))
-            sys.exit(1)
+            node_info = await dracoon.nodes.get_node_from_path(path=parsed_path)
 
+            if not node_info:
+                typer.echo(format_error_message(msg=f"Node not found ({parsed_path})."))
+                sys.exit(1)
 
-        if node_info and node_info.isEncrypted is True:
 
-            crypto_secret = get_crypto_credentials(base_url)
-            await init_keypair(
-                dracoon=dracoon, base_url=base_url, crypto_secret=crypto_secret
-            )
-        
-        is_container = node_info.type == NodeType.folder or node_info.type == NodeType.room
-        is_file_path = node_info.type == NodeType.file
+            if node_info and node_info.isEncrypted is True:
 
-        if is_container and not recursive:
-            typer.echo(
-                format_error_message(
-                    msg="Folder or room can only be downloaded via recursive (-r) flag."
+                crypto_secret = get_crypto_credentials(base_url)
+                await init_keypair(
+                    dracoon=dracoon, base_url=base_url, crypto_secret=crypto_secret
                 )
-            )
-            await dracoon.logout()
-            sys.exit(1)
-        elif is_container and recursive:
-            try:
-                download_list = await create_download_list(dracoon=dracoon, node_info=node_info,
-                                                           target_path=target_dir_path)
-            except InvalidPathError:
+
+            is_container = node_info.type == NodeType.folder or node_info.type == NodeType.room
+            is_file_path = node_info.type == NodeType.file
+
+            if is_container and not recursive:
                 typer.echo(
                     format_error_message(
-                        msg=f"Target path does not exist ({target_dir_path})"
+                        msg="Folder or room can only be downloaded via recursive (-r) flag."
                     )
                 )
-                await dracoon.logout()
                 sys.exit(1)
+            elif is_container and recursive:
+                try:
+                    download_list = await create_download_list(dracoon=dracoon, node_info=node_info,
+                                                               target_path=target_dir_path)
+                except InvalidPathError:
+                    typer.echo(
+                        format_error_message(
+                            msg=f"Target path does not exist ({target_dir_path})"
+                        )
+                    )
+                    sys.exit(1)
+
+                try:
+                    await bulk_download(dracoon=dracoon, download_list=download_list, velocity=velocity)
+                except FileConflictError:
+                    typer.echo(
+                        format_error_message(
+                            msg=f"File already exists on target path ({target_dir_path})"
+                        )
+                    )
+                    sys.exit(1)
+                except PermissionError:
+                    typer.echo(
+                        format_error_message(
+                            msg=f"Cannot write on target path ({target_dir_path})"
+                        )
+                    )
+                    sys.exit(1)
 
-            try:
-                await bulk_download(dracoon=dracoon, download_list=download_list, velocity=velocity)
                 typer.echo(
                     f'{format_success_message(f"{node_info.type.value} {node_info.name} downloaded to {target_dir_path}.")}'
                 )
-            except HTTPUnauthorizedError:
-                await graceful_exit(dracoon=dracoon)
-                delete_credentials(base_url=base_url)
-                format_error_message(
-                        msg="Re-authentication required - please run operation again with new login."
-                )
-                sys.exit(1)
-            except FileConflictError:
-                typer.echo(
-                    format_error_message(
-                        msg=f"File already exists on target path ({target_dir_path})"
+            elif is_file_path:
+                if node_info.size:
+                    size = node_info.size
+                else:
+                    size = 0
+                transfer = DCTransferList(total=size, file_count=1)
+                download_job = DCTransfer(transfer=transfer)
+
+                try:
+                    await dracoon.download(
+                        file_path=parsed_path,
+                        target_path=target_dir_path,
+                        raise_on_err=True,
+                        callback_fn=download_job.update
                     )
+                    typer.echo(
+                    f'{format_success_message(f"File {file_name} downloaded to {target_dir_path}.")}'
                 )
-                sys.exit(1)
-            except DRACOONHttpError:
-                await dracoon.logout()
-                typer.echo(format_error_message(msg="Error downloading file."))
-                sys.exit(1)
-            except PermissionError:
-                await dracoon.logout()
-                typer.echo(
-                    format_error_message(
-                        msg=f"Cannot write on target path ({target_dir_path})"
+                # to do: replace with handling via PermissionError
+                except UnboundLocalError:
+                    typer.echo(
+                    format_error_message(msg=f"Insufficient permissions on target path ({target_dir_path})")
                     )
-                )
-            finally:
-                await dracoon.logout()
-        elif is_file_path:
-            if node_info.size:
-                size = node_info.size
-            else:
-                size = 0
-            transfer = DCTransferList(total=size, file_count=1)
-            download_job = DCTransfer(transfer=transfer)
-
-            try:
-                await dracoon.download(
-                    file_path=parsed_path,
-                    target_path=target_dir_path,
-                    raise_on_err=True,
-                    callback_fn=download_job.update
-                )
-                typer.echo(
-                f'{format_success_message(f"File {file_name} downloaded to {target_dir_path}.")}'
-            )
-            # to do: replace with handling via PermissionError
-            except UnboundLocalError:
-                await dracoon.logout()
-                typer.echo(
-                format_error_message(msg=f"Insufficient permissions on target path ({target_dir_path})")
-                )
-                sys.exit(1)
-            except InvalidPathError:
-                await dracoon.logout()
-                typer.echo(
-                format_error_message(msg=f"Path must be a folder ({target_dir_path})")
-                )
-                sys.exit(1)
-            except InvalidFileError:
-                await dracoon.logout()
-                typer.echo(format_error_message(msg=f"File does not exist ({parsed_path})"))
-                sys.exit(1)
-            except FileConflictError:
-                await dracoon.logout()
-                typer.echo(
-                    format_error_message(
-                        msg=f"File already exists on target path ({target_dir_path})"
+                    sys.exit(1)
+                except InvalidPathError:
+                    typer.echo(
+                    format_error_message(msg=f"Path must be a folder ({target_dir_path})")
                     )
-                )
-                sys.exit(1)
-            except HTTPUnauthorizedError:
-                await graceful_exit(dracoon=dracoon)
-                delete_credentials(base_url=base_url)
-                format_error_message(
-                        msg="Re-authentication required - please run operation again with new login."
-                )
-                sys.exit(1)
-            except DRACOONHttpError:
-                await dracoon.logout()
-                typer.echo(format_error_message(msg="Error downloading file."))
-                sys.exit(1)
-            except PermissionError:
-                await dracoon.logout()
-                typer.echo(
-                    format_error_message(
-                        msg=f"Cannot write on target path ({target_dir_path})"
+                    sys.exit(1)
+                except InvalidFileError:
+                    typer.echo(format_error_message(msg=f"File does not exist ({parsed_path})"))
+                    sys.exit(1)
+                except FileConflictError:
+                    typer.echo(
+                        format_error_message(
+                            msg=f"File already exists on target path ({target_dir_path})"
+                        )
+                    )
+                    sys.exit(1)
+                except PermissionError:
+                    typer.echo(
+                        format_error_message(
+                            msg=f"Cannot write on target path ({target_dir_path})"
+                        )
                     )
+                    sys.exit(1)
+                except KeyboardInterrupt:
+                    typer.echo(
+                    f'{format_success_message(f"Download canceled ({file_name}).")}'
                 )
-                sys.exit(1)
-            except KeyboardInterrupt:
-                await dracoon.logout()
-                typer.echo(
-                f'{format_success_message(f"Download canceled ({file_name}).")}'
-            )
 
 
 
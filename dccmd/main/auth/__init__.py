@@ -17,8 +17,9 @@ from .credentials import (
     delete_credentials,
     get_crypto_credentials,
     delete_crypto_credentials,
+    delete_access_token,
 )
-from .util import login
+from .util import login, revoke_session
 from ..util import (
     format_error_message,
     format_success_message,
@@ -44,6 +45,7 @@ def rm(
         sys.exit(1)
 
     delete_credentials(base_url)
+    delete_access_token(base_url)
 
     if crypto:
         delete_crypto_credentials(base_url)
@@ -53,6 +55,35 @@ def rm(
     typer.echo(format_success_message(msg=f"Refresh token removed for {base_url}"))
 
 
+@auth_app.command()
+def logout(
+    base_url: str = typer.Argument(..., help="Base DRACOON url (example: dracoon.team)")
+):
+    """revokes the cached access token (session) for OAuth2 authentication in DRACOON"""
+
+    async def _logout():
+
+        parsed_base_url = parse_base_url(full_path=f"{base_url}/")
+
+        try:
+            revoked = await revoke_session(base_url=parsed_base_url)
+        except ConnectionError:
+            typer.echo(
+                format_error_message(msg=f"Could not connect to DRACOON url: {base_url}")
+            )
+            sys.exit(1)
+
+        if not revoked:
+            typer.echo(
+                format_error_message(msg=f"No active session for DRACOON url: {base_url}")
+            )
+            sys.exit(1)
+
+        typer.echo(format_success_message(msg=f"Session closed for {base_url}"))
+
+    asyncio.run(_logout())
+
+
 @auth_app.command()
 #pylint: disable=C0103
 def ls(
@@ -3,7 +3,10 @@ All functions to store credentials (authentication, client, crypto)
 Using keyring
 """
 
+import hashlib
+
 import keyring
+from keyring.errors import PasswordDeleteError
 
 from ..models.errors import DCClientParseError
 
@@ -27,6 +30,51 @@ def delete_credentials(base_url: str):
     return
 
 
+def get_token_fingerprint(refresh_token: str) -> str:
+    """get fingerprint of a refresh token (ties cached access tokens to their user)"""
+    return hashlib.sha256(refresh_token.encode()).hexdigest()[:16]
+
+
+def store_access_token(
+    base_url: str, access_token: str, expires_at: float, refresh_token: str
+):
+    """store access token, its expiry (epoch seconds) and refresh token fingerprint for given DRACOON url"""
+    keyring.set_password(
+        SERVICE_NAME,
+        base_url + "-access",
+        f"{access_token} {expires_at} {get_token_fingerprint(refresh_token)}",
+    )
+    return
+
+
+def get_access_token(base_url: str, refresh_token: str = None) -> tuple[str, float]:
+    """get stored access token and its expiry (epoch seconds) for given DRACOON url
+    (only if issued for given refresh token)"""
+    creds = keyring.get_password(SERVICE_NAME, base_url + "-access")
+
+    if not creds or len(creds.split(" ")) != 3:
+        return None, 0
+
+    access_token, expires_at, fingerprint = creds.split(" ")
+
+    if refresh_token is not None and fingerprint != get_token_fingerprint(refresh_token):
+        return None, 0
+
+    try:
+        return access_token, float(expires_at)
+    except ValueError:
+        return None, 0
+
+
+def delete_access_token(base_url: str):
+    """delete stored access token for given DRACOON url"""
+    try:
+        keyring.delete_password(SERVICE_NAME, base_url + "-access")
+    except PasswordDeleteError:
+        pass
+    return
+
+
 def store_crypto_credentials(base_url: str, crypto_secret: str):
     """store encryption password for given DRACOON url"""
     keyring.set_password(SERVICE_NAME, base_url + "-crypto", crypto_secret)
@@ -3,13 +3,18 @@ Module with utility functions for authentication
 - Login (OAuth flows)
 - Initialize instance with CLI config
 """
+import asyncio
 import logging
 import sys
+import time
+from datetime import datetime
 from typing import Tuple
 
 import typer
 import httpx
+import orjson
 from dracoon import DRACOON, OAuth2ConnectionType
+from dracoon.client import DRACOONConnection
 from dracoon.errors import HTTPUnauthorizedError, DRACOONHttpError, HTTPBadRequestError
 from dccmd import __version__ as dccmd_version
 from dccmd import __name__ as dccmd_name
@@ -23,10 +28,93 @@ from .credentials import (
     delete_credentials,
     store_credentials,
     get_credentials,
+    store_access_token,
+    get_access_token,
+    delete_access_token,
 )
 
 DEFAULT_TIMEOUT_CONFIG = httpx.Timeout(None, connect=None, read=None)
 
+# connection pool shared by all requests of a command (keep-alive)
+DEFAULT_LIMITS_CONFIG = httpx.Limits(
+    max_keepalive_connections=64, max_connections=128, keepalive_expiry=60
+)
+
+# minimum remaining validity (seconds) to reuse a cached access token
+ACCESS_TOKEN_MIN_VALIDITY = 60
+
+# in-process cache of validated DRACOON urls
+_DRACOON_URL_CACHE: set[str] = set()
+
+class ORJSONResponse(httpx.Response):
+    """httpx response decoding JSON via orjson"""
+
+    def json(self, **kwargs):
+        return orjson.loads(self.content)
+
+
+class ORJSONTransport(httpx.AsyncHTTPTransport):
+    """httpx transport returning responses decoded via orjson (used by DRACOON clients)"""
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await super().handle_async_request(request)
+        return ORJSONResponse(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=response.stream,
+            extensions=response.extensions,
+            request=request,
+        )
+
+
+class DCDracoon(DRACOON):
+    """DRACOON instance which drops the cached access token on logout"""
+
+    async def logout(self, revoke_refresh_token: bool = False) -> None:
+        await super().logout(revoke_refresh_token=revoke_refresh_token)
+        # revoked token must not be resumed by later commands
+        delete_access_token(self.client.base_url)
+
+
+def create_dracoon(
+    base_url: str, client_id: str, client_secret: str, debug: bool = False
+) -> DRACOON:
+    """function to create an unauthenticated DRACOON instance with CLI config"""
+
+    log_level = logging.INFO
+
+    if debug:
+        log_level = logging.DEBUG
+
+    dracoon = DCDracoon(
+        base_url=base_url,
+        client_id=client_id,
+        client_secret=client_secret,
+        log_level=log_level,
+        log_stream=debug,
+        log_file_out=True,
+        raise_on_err=True
+    )
+
+    # set custom user agent
+    dracoon_user_agent = dracoon.client.http.headers["User-Agent"]
+    dracoon.client.http.headers["User-Agent"] = f"{dccmd_name}|{dccmd_version}|{dracoon_user_agent}"
+
+    # set custom client with no timeout, up- and downloader with same client !!!
+    # API requests are multiplexed via HTTP/2 - transfers keep one connection per chunk (HTTP/1.1)
+    # JSON responses are decoded via orjson, connection errors retried (as in dracoon)
+    dracoon.client.http = httpx.AsyncClient(
+        headers=dracoon.client.headers, timeout=DEFAULT_TIMEOUT_CONFIG,
+        transport=ORJSONTransport(limits=DEFAULT_LIMITS_CONFIG, http2=True, retries=5)
+    )
+    dracoon.client.uploader = httpx.AsyncClient(
+        timeout=DEFAULT_TIMEOUT_CONFIG,
+        transport=ORJSONTransport(limits=DEFAULT_LIMITS_CONFIG, retries=5)
+    )
+    dracoon.client.downloader = dracoon.client.uploader
+
+    return dracoon
+
 async def login(
     base_url: str,
     refresh_token: str = None,
@@ -51,29 +139,9 @@ async def login(
         client_id, client_secret = await register_client(base_url)
 
     # instantiate DRACOON
-    log_level = logging.INFO
-
-    if debug:
-        log_level = logging.DEBUG
-
-    dracoon = DRACOON(
-        base_url=base_url,
-        client_id=client_id,
-        client_secret=client_secret,
-        log_level=log_level,
-        log_stream=debug,
-        log_file_out=True,
-        raise_on_err=True
+    dracoon = create_dracoon(
+        base_url=base_url, client_id=client_id, client_secret=client_secret, debug=debug
     )
-    
-    # set custom user agent
-    dracoon_user_agent = dracoon.client.http.headers["User-Agent"]
-    dracoon.client.http.headers["User-Agent"] = f"{dccmd_name}|{dccmd_version}|{dracoon_user_agent}"
-
-    # set custom client with no timeout, up- and downloader with same client !!!
-    dracoon.client.http = httpx.AsyncClient(headers=dracoon.client.headers, timeout=DEFAULT_TIMEOUT_CONFIG)
-    dracoon.client.uploader = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT_CONFIG)
-    dracoon.client.downloader = dracoon.client.uploader
 
     # password flow
     if cli_mode:
@@ -132,6 +200,14 @@ async def init_dracoon(
     # get stored credentials
     refresh_token = get_credentials(base_url)
 
+    # reuse cached access token (not in cli mode - user may differ)
+    if refresh_token and not cli_mode:
+        dracoon = await resume_session(
+            base_url=base_url, refresh_token=refresh_token, debug=debug
+        )
+        if dracoon is not None:
+            return dracoon, base_url
+
     # log in
     dracoon = await login(
         base_url=base_url,
@@ -145,6 +221,133 @@ async def init_dracoon(
     return dracoon, base_url
 
 
+async def resume_session(
+    base_url: str, refresh_token: str, debug: bool = False
+) -> DRACOON:
+    """function to resume a session from a cached access token - returns None if not possible"""
+
+    # only reuse a token issued for the stored refresh token (same user)
+    access_token, expires_at = get_access_token(base_url, refresh_token=refresh_token)
+
+    if not access_token or expires_at - time.time() <= ACCESS_TOKEN_MIN_VALIDITY:
+        return None
+
+    try:
+        client_id, client_secret = get_client_credentials(base_url)
+    except DCClientParseError:
+        return None
+
+    dracoon = create_dracoon(
+        base_url=base_url, client_id=client_id, client_secret=client_secret, debug=debug
+    )
+
+    try:
+        return await _login_access_token(
+            dracoon=dracoon,
+            access_token=access_token,
+            expires_at=expires_at,
+            refresh_token=refresh_token,
+        )
+    except (DRACOONHttpError, httpx.RequestError):
+        await dracoon.client.disconnect()
+        delete_access_token(base_url)
+        return None
+
+
+async def release_session(
+    dracoon: DRACOON, base_url: str, cli_mode: bool = False, invalidate: bool = False
+):
+    """cache the access token of a session for reuse and close the http clients"""
+
+    # never cache in cli mode - session user may differ from stored credentials
+    if cli_mode:
+        await dracoon.client.disconnect()
+        return
+
+    connection = dracoon.client.connection
+
+    # session was logged out, invalidated (or never established) - drop cached token
+    if connection is None or invalidate:
+        delete_access_token(base_url)
+        await dracoon.client.disconnect()
+        return
+
+    expires_at = connection.connected_at.timestamp() + connection.access_token_validity
+
+    # only cache if the token belongs to the stored credentials
+    refresh_token = get_credentials(base_url)
+    if refresh_token and refresh_token == connection.refresh_token:
+        store_access_token(
+            base_url=base_url,
+            access_token=connection.access_token,
+            expires_at=expires_at,
+            refresh_token=refresh_token,
+        )
+
+    await dracoon.client.disconnect()
+
+
+async def revoke_session(base_url: str, debug: bool = False) -> bool:
+    """revoke the stored access token without logging in - returns False if none is stored
+    (raises ConnectionError if DRACOON is not reachable)"""
+
+    access_token, expires_at = get_access_token(base_url)
+
+    if not access_token:
+        return False
+
+    try:
+        client_id, client_secret = get_client_credentials(base_url)
+    except DCClientParseError:
+        delete_access_token(base_url)
+        return True
+
+    dracoon = create_dracoon(
+        base_url=base_url, client_id=client_id, client_secret=client_secret, debug=debug
+    )
+    dracoon.client.connection = DRACOONConnection(
+        datetime.now(),
+        access_token,
+        max(0, int(expires_at - time.time())),
+        get_credentials(base_url),
+    )
+    dracoon.client.connected = True
+
+    try:
+        await dracoon.client.logout()
+    except DRACOONHttpError:
+        # token already expired or revoked
+        pass
+    finally:
+        await dracoon.client.disconnect()
+
+    delete_access_token(base_url)
+
+    return True
+
+
+async def _login_access_token(
+    dracoon: DRACOON, access_token: str, expires_at: float, refresh_token: str
+) -> DRACOON:
+
+    connection = DRACOONConnection(
+        datetime.now(), access_token, int(expires_at - time.time()), refresh_token
+    )
+
+    dracoon.client.connection = connection
+    dracoon.client.connected = True
+    dracoon.client.http.headers["Authorization"] = "Bearer " + access_token
+    dracoon.connection = connection
+
+    # account and system info is required for up- and downloads
+    dracoon.user_info, dracoon.system_info = await asyncio.gather(
+        dracoon.user.get_account_information(raise_on_err=True),
+        dracoon.public.get_system_info(raise_on_err=True),
+    )
+
+    return dracoon
+
+
 async def _login_password_flow(
     base_url: str, dracoon: DRACOON, username: str, password: str
 ) -> DRACOON:
@@ -256,6 +459,9 @@ async def is_dracoon_url(base_url: str) -> bool:
     if base_url[-1] == "/":
         base_url = base_url[:-1]
 
+    if base_url in _DRACOON_URL_CACHE:
+        return True
+
     info_url = base_url + "/api/v4/public/software/version"
 
     async with httpx.AsyncClient() as client:
@@ -267,6 +473,8 @@ async def is_dracoon_url(base_url: str) -> bool:
         except httpx.HTTPStatusError as err:
             return False
 
+    _DRACOON_URL_CACHE.add(base_url)
+
     return True
 
 async def register_client(base_url: str):
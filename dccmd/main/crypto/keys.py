@@ -3,14 +3,37 @@ Module implementig file key distrubtion for
 crypto uploads and beyond
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
 import typer
 
 from dracoon import DRACOON
 from dracoon.crypto import decrypt_file_key, encrypt_file_key_public
 
+# missing keys encrypted per worker task
+KEY_BATCH_SIZE = 50
+
+
+def _seal_batch(batch: list, plain_file_keys: dict, public_keys: dict) -> list:
+    """encrypt plain file keys for a batch of missing keys (runs in a worker thread)"""
+    return [
+        (
+            key.fileId,
+            key.userId,
+            encrypt_file_key_public(
+                plain_file_key=plain_file_keys[key.fileId],
+                public_key=public_keys[key.userId],
+            ),
+        )
+        for key in batch
+    ]
+
 
 async def distribute_missing_keys(
-    dracoon: DRACOON, file_id: int = None, room_id: int = None
+    dracoon: DRACOON, file_id: int = None, room_id: int = None, verbose: bool = True
 ):
     """get missing file keys by filter (room or file)"""
 
@@ -19,39 +42,77 @@ async def distribute_missing_keys(
     )
 
     if missing_keys.range.total == 0:
-        typer.echo("No file keys to distribute for given path.")
+        if verbose:
+            typer.echo("No file keys to distribute for given path.")
         return
 
-    typer.echo(f"Total keys: {missing_keys.range.total}")
+    if verbose:
+        typer.echo(f"Total keys: {missing_keys.range.total}")
 
     keys = dracoon.nodes.make_set_file_keys(file_key_list=[])
 
-    # loop through every missing key entry
-    #pylint: disable=C0301
-    with typer.progressbar(iterable=missing_keys.items, label="Distributing file keys...") as missing_keys_list:
-        for key in missing_keys_list:
-
-            for file_item in missing_keys.files:
-                # match file by id
-                if key.fileId == file_item.id:
-                    file_key = file_item.fileKeyContainer
-                    # get plain file key
-                    plain_file_key = decrypt_file_key(
-                        file_key=file_key, keypair=dracoon.plain_keypair
-                    )
+    public_keys = {user.id: user.publicKeyContainer for user in missing_keys.users}
+    file_keys = {file_item.id: file_item.fileKeyContainer for file_item in missing_keys.files}
 
-            for user in missing_keys.users:
-                if key.userId == user.id:
-                    public_key = user.publicKeyContainer
+    loop = asyncio.get_running_loop()
 
-            user_file_key = encrypt_file_key_public(
-                plain_file_key=plain_file_key, public_key=public_key
-            )
+    # crypto releases the GIL - threads avoid process pool overhead
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
 
-            file_key_item = dracoon.nodes.make_set_file_key_item(
-                file_id=key.fileId, user_id=key.userId, file_key=user_file_key
+        async def decrypt(file_id: int):
+            """get plain file key (once per file)"""
+            plain_file_key = await loop.run_in_executor(
+                pool, decrypt_file_key, file_keys[file_id], dracoon.plain_keypair
             )
+            return file_id, plain_file_key
+
+        file_ids = {key.fileId for key in missing_keys.items}
+        plain_file_keys = dict(await asyncio.gather(*(decrypt(file_id) for file_id in file_ids)))
+
+        batches = [
+            missing_keys.items[i:i + KEY_BATCH_SIZE]
+            for i in range(0, len(missing_keys.items), KEY_BATCH_SIZE)
+        ]
+        seal_reqs = [
+            loop.run_in_executor(pool, _seal_batch, batch, plain_file_keys, public_keys)
+            for batch in batches
+        ]
 
-            keys.items.append(file_key_item)
+        # background passes run silently (no progress bar)
+        if verbose:
+            progress_bar = typer.progressbar(length=len(missing_keys.items), label="Distributing file keys...")
+        else:
+            progress_bar = nullcontext()
+
+        with progress_bar as progress:
+            for sealed in asyncio.as_completed(seal_reqs):
+                batch_keys = await sealed
+                for key_file_id, user_id, user_file_key in batch_keys:
+                    file_key_item = dracoon.nodes.make_set_file_key_item(
+                        file_id=key_file_id, user_id=user_id, file_key=user_file_key
+                    )
+                    keys.items.append(file_key_item)
+                if progress is not None:
+                    progress.update(len(batch_keys))
 
     await dracoon.nodes.set_file_keys(file_keys=keys)
+
+
+async def drain_missing_keys(dracoon: DRACOON, queue: asyncio.Queue, room_id: int):
+    """distribute missing keys of a room while files are uploaded (None marks the end of the upload)"""
+
+    done = False
+
+    while not done:
+        item = await queue.get()
+
+        # files uploaded in the meantime are covered by a single pass
+        while True:
+            if item is None:
+                done = True
+            if queue.empty():
+                break
+            item = queue.get_nowait()
+
+        # final pass catches files uploaded during previous passes
+        await distribute_missing_keys(dracoon=dracoon, room_id=room_id, verbose=done)
@@ -49,5 +49,5 @@ async def init_keypair(dracoon: DRACOON, base_url: str, crypto_secret: str = Non
             store_crypto_credentials(
                         base_url=base_url, crypto_secret=crypto_secret
                     )
-
-    await get_keypair(dracoon=dracoon, crypto_secret=crypto_secret)
+    else:
+        await get_keypair(dracoon=dracoon, crypto_secret=crypto_secret)
@@ -4,15 +4,19 @@ and bulk creation of folders in DRACOON
 """
 
 
+import math
 import os
 import platform
+import stat
 import sys
 import asyncio
 from pathlib import Path
+from typing import Callable
 
 import typer
 from httpx import WriteTimeout
 from dracoon import DRACOON, OAuth2ConnectionType
+from dracoon.nodes import MAX_CHUNKS
 from dracoon.errors import (
     InvalidPathError,
     HTTPConflictError,
@@ -22,6 +26,12 @@ from dracoon.errors import (
 from ..models import DCTransfer, DCTransferList
 from ..util import format_error_message
 
+# concurrent file uploads per velocity (1: slow, 2: normal, 3: fast)
+UPLOAD_CONCURRENCY = {1: 4, 2: 16, 3: 64}
+
+# chunk size for bulk uploads (S3 minimum part size) - bounds memory per in-flight chunk
+UPLOAD_CHUNK_SIZE = 5242880
+
 class DirectoryItem:
     """object representing a directory with all required path elements"""
 
@@ -31,9 +41,8 @@ class DirectoryItem:
         else:
             self.dir_path = dir_path
         self.abs_path = self.dir_path.replace(base_path, "")
-        self.name = self.abs_path.split("/")[-1]
-        self.parent_path = ("/").join(self.abs_path.split("/")[:-1])
-        self.level = len(self.abs_path.split("/")) - 1
+        self.parent_path, _, self.name = self.abs_path.rpartition("/")
+        self.level = self.abs_path.count("/")
 
 
 class DirectoryItemList:
@@ -58,16 +67,6 @@ class DirectoryItemList:
         level_list.sort(key=lambda dir: dir.abs_path)
         return level_list
 
-    def get_by_parent(self, parent: str):
-        """get all directories by parent"""
-        return [dir for dir in self.dir_list if dir.parent_path == parent]
-
-    def get_batches(self, level: int) -> list[list[DirectoryItem]]:
-        """create batches based on depth levels"""
-        parent_list = set([dir.parent_path for dir in self.get_level(level=level)])
-
-        return [self.get_by_parent(parent) for parent in parent_list]
-
 
 class FileItem:
     """object representing a single file"""
@@ -77,13 +76,10 @@ class FileItem:
             self.dir_path = dir_path.replace("\\", "/")
         else:
             self.dir_path = dir_path
-        self.x_path = Path(dir_path)
         self.abs_path = self.dir_path.replace(base_path, "")
-        self.name = self.abs_path.split("/")[-1]
-        self.parent_path = ("/").join(self.abs_path.split("/")[:-1])
-        self.level = len(self.abs_path.split("/")) - 1
+        self.parent_path, _, self.name = self.abs_path.rpartition("/")
+        self.level = self.abs_path.count("/")
         self.size = os.path.getsize(self.dir_path)
-        self.x_size = self.x_path.stat().st_size
 
 class FileItemList:
     """object representing all files in a path (recursively)"""
@@ -168,40 +164,78 @@ def is_file(folder_path: str) -> bool:
     return parsed_path.is_file()
 
 
+def classify(path: str) -> tuple[str, int]:
+    """get type ("dir", "file", "other" or "none") and size of a path with a single stat"""
+    # missing, not a directory (e.g. file/x), symlink loops etc.
+    try:
+        mode_stat = os.stat(path)
+    except OSError:
+        return "none", 0
+
+    if stat.S_ISDIR(mode_stat.st_mode):
+        return "dir", mode_stat.st_size
+    if stat.S_ISREG(mode_stat.st_mode):
+        return "file", mode_stat.st_size
+    return "other", mode_stat.st_size
+
+
 def is_win32() -> bool:
     """check if OS is Windows"""
     return platform.system() == "Windows"
 
 
 async def create_folder_struct(source: str, target: str, dracoon: DRACOON, velocity: int = 2):
-    """create all necessary folders for a recursive folder upload"""
+    """create all necessary folders for a recursive folder upload (one round trip per level)"""
 
-    velocity = max(1, min(velocity, 10)) # refactor to one line
-    async def process_batch(batch):
-        """process a batch of folders to create"""
+    sub_folders = DirectoryItemList(source_path=source)
 
-        path = target.rstrip('/') + '/' + batch[0].parent_path.lstrip('/')
-        parent_node = await dracoon.nodes.get_node_from_path(path)
+    typer.echo(f"{len(sub_folders.dir_list)} folders to process.")
 
-        if parent_node is None:
-            dracoon.logger.debug(path)
+    target_node = await dracoon.nodes.get_node_from_path(target)
 
-        parent_id = parent_node.id
+    if target_node is None:
+        typer.echo(format_error_message(msg=f"Invalid target path: {target}"))
+        sys.exit(1)
 
-        # create list of folder requests
-        folder_reqs = [
-            asyncio.ensure_future(create_folder(name=item.name, parent_id=parent_id, dracoon=dracoon))
-            for item in batch
-        ]
+    # node ids of created folders by relative path - parents are always created one level before
+    node_ids = {"": target_node.id}
+    sem = asyncio.Semaphore(get_upload_concurrency(velocity))
 
-        # process 10 folders per batch
-        for reqs in dracoon.batch_process(coro_list=folder_reqs, batch_size=velocity):
+    async def process_folder(item: DirectoryItem):
+        """create a single folder - resolves existing folders by path"""
+        async with sem:
             try:
-                # get new token to avoid rate limiting
+                node = await create_folder(
+                    name=item.name, parent_id=node_ids[item.parent_path], dracoon=dracoon
+                )
+            except (HTTPConflictError, WriteTimeout):
+                # folder already exists (or may have been created) - fetch id for sub folders
+                node = await dracoon.nodes.get_node_from_path(
+                    target.rstrip('/') + '/' + item.abs_path.lstrip('/')
+                )
+
+        if node is None:
+            dracoon.logger.error(f"Folder could not be created: {item.abs_path}")
+            return
+        node_ids[item.abs_path] = node.id
+
+    with typer.progressbar(
+        iterable=sorted(sub_folders.levels), label="Creating folder structure..."
+    ) as levels:
+        # iterate over all levels (depth) - each level only depends on the previous one
+        for level in levels:
+
+            if not await dracoon.client.check_access_token():
                 await dracoon.connect(connection_type=OAuth2ConnectionType.refresh_token)
-                await asyncio.gather(*reqs)
-            except HTTPConflictError:
-                pass
+
+            # skip folders below parents which could not be created
+            level_list = [
+                item for item in sub_folders.get_level(level=level) if item.parent_path in node_ids
+            ]
+            folder_reqs = [asyncio.ensure_future(process_folder(item)) for item in level_list]
+
+            try:
+                await asyncio.gather(*folder_reqs)
             except HTTPForbiddenError:
                 for req in folder_reqs:
                     req.cancel()
@@ -220,35 +254,17 @@ async def create_folder_struct(source: str, target: str, dracoon: DRACOON, veloc
                     format_error_message(msg="An error ocurred creating the folder.")
                 )
                 sys.exit(1)
-            except WriteTimeout:
-                continue
 
-    sub_folders = DirectoryItemList(source_path=source)
+def get_chunk_size(file_size: int, chunk_size: int = UPLOAD_CHUNK_SIZE) -> int:
+    """get chunk size for a file - raised for large files to stay within the S3 part limit"""
+    return max(chunk_size, math.ceil(file_size / MAX_CHUNKS))
 
-    typer.echo(f"{len(sub_folders.dir_list)} folders to process.")
 
-    with typer.progressbar(
-        iterable=sub_folders.levels, label="Creating folder structure..."
-    ) as levels:
-        # iterate over all levels (depth)
-        for level in levels:
+def get_upload_concurrency(velocity: int) -> int:
+    """get number of concurrent file uploads for a velocity factor"""
+    velocity = max(1, min(velocity, 3))
+    return UPLOAD_CONCURRENCY[velocity]
 
-            # fetch batches per level
-            batches = sub_folders.get_batches(level=level)
-
-            folder_reqs = [asyncio.ensure_future(process_batch(item)) for item in batches]
-            # process 3 batches in parallel per level
-            for batch in dracoon.batch_process(coro_list=folder_reqs, batch_size=3):
-                try:
-                    await asyncio.gather(*batch)
-                except DRACOONHttpError:
-                    for req in folder_reqs:
-                        req.cancel()
-                        await dracoon.logout()
-                        typer.echo(
-                           format_error_message(msg="An error ocurred creating the folder.")
-                           )
-                        sys.exit(1)
 
 async def bulk_upload(
     source: str,
@@ -256,8 +272,10 @@ async def bulk_upload(
     dracoon: DRACOON,
     resolution_strategy: str = "fail",
     velocity: int = 2,
+    sem: asyncio.Semaphore = None,
+    on_file_uploaded: Callable[[FileItem], None] = None,
 ):
-    """upload a list of files in a given source path"""
+    """upload a list of files in a given source path (optional callback per uploaded file)"""
 
     file_list = FileItemList(source_path=source)
 
@@ -269,56 +287,67 @@ async def bulk_upload(
     file_list.sort_by_size()
     transfer_list = DCTransferList(total=file_list.total_size, file_count=file_list.file_count)
 
-    velocity = max(1, min(velocity, 10))
+    if sem is None:
+        sem = asyncio.Semaphore(get_upload_concurrency(velocity))
 
-    concurrent_reqs = velocity * 5
+    # refresh token once expired (avoid concurrent refreshes)
+    token_lock = asyncio.Lock()
 
-    upload_reqs = []
-
-    for item in file_list.file_list:
+    async def upload_file(item: FileItem):
+        """upload a single file item - ignores existing files"""
         upload_job = DCTransfer(transfer=transfer_list)
         dracoon.logger.debug(target + '/' + item.parent_path)
         dracoon.logger.debug(item.dir_path)
         target_path = target.rstrip('/') + '/' + item.parent_path.lstrip('/')
-        req = dracoon.upload(
-            file_path=item.dir_path,
-            target_path=(target_path),
-            resolution_strategy=resolution_strategy,
-            callback_fn=upload_job.update
-        )
-        upload_reqs.append(asyncio.ensure_future(req))
-
-
-    for batch in dracoon.batch_process(
-            coro_list=upload_reqs, batch_size=concurrent_reqs
-        ):
-        try:
-            # get fresh token per batch (avoid rate limiting)
-            await dracoon.connect(connection_type=OAuth2ConnectionType.refresh_token)
-            await asyncio.gather(*batch)
-        except HTTPConflictError:
-            # ignore file already exists error
-            continue
-        except HTTPForbiddenError:
-            for req in upload_reqs:
-                req.cancel()
-            await dracoon.logout()
-            typer.echo(
-                    format_error_message(
-                        msg="Insufficient permissions (create / esdit required)."
-                    )
+
+        # 429 / 5xx are retried by dracoon per request
+        async with sem:
+            async with token_lock:
+                if not await dracoon.client.check_access_token():
+                    await dracoon.connect(connection_type=OAuth2ConnectionType.refresh_token)
+
+            try:
+                await dracoon.upload(
+                    file_path=item.dir_path,
+                    target_path=target_path,
+                    resolution_strategy=resolution_strategy,
+                    callback_fn=upload_job.update,
+                    raise_on_err=True,
+                    chunksize=get_chunk_size(item.size)
                 )
-            sys.exit(1)
-        except DRACOONHttpError:
-            for req in upload_reqs:
-                req.cancel()
-            await dracoon.logout()
-            typer.echo(
-                    format_error_message(msg="An error ocurred uploading files.")
+            except HTTPConflictError:
+                # ignore file already exists error
+                dracoon.logger.info(f"File already exists: {item.dir_path}")
+                return
+            except WriteTimeout:
+                dracoon.logger.error(f"Upload timeout: {item.dir_path}")
+                return
+
+        if on_file_uploaded is not None:
+            on_file_uploaded(item)
+
+    upload_reqs = [asyncio.ensure_future(upload_file(item)) for item in file_list.file_list]
+
+    try:
+        await asyncio.gather(*upload_reqs)
+    except HTTPForbiddenError:
+        for req in upload_reqs:
+            req.cancel()
+        await dracoon.logout()
+        typer.echo(
+                format_error_message(
+                    msg="Insufficient permissions (create / esdit required)."
                 )
-            sys.exit(1)
-        except WriteTimeout:
-            continue
+            )
+        sys.exit(1)
+    except DRACOONHttpError:
+        for req in upload_reqs:
+            req.cancel()
+        await dracoon.logout()
+        typer.echo(
+                format_error_message(msg="An error ocurred uploading files.")
+            )
+        sys.exit(1)
 
 
 def create_folder(name: str, parent_id: int, dracoon: DRACOON):
@@ -9,12 +9,21 @@ Collection of helpers / utils
 
 
 
+import functools
 import math
+import sys
+import urllib.parse
+from datetime import datetime
+from typing import Tuple
+
+import httpx
 import typer
+from tenacity import retry
 
-from dracoon import DRACOON
-from dracoon.client import DRACOONConnection
-from dracoon.nodes.models import Node, NodeType
+from dracoon import DRACOON, OAuth2ConnectionType
+from dracoon.client import RETRY_CONFIG
+from dracoon.errors import HTTPUnauthorizedError
+from dracoon.nodes.models import NodeType
 
 from ..models.errors import DCPathParseError
 
@@ -40,6 +49,7 @@ def split_path(path: str):
     return path_parts
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_base_url(full_path: str):
     """get base url from full path"""
     full_path = remove_https(full_path)
@@ -49,6 +59,7 @@ def parse_base_url(full_path: str):
     return f"https://{path_parts[0]}"
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_file_name(full_path: str):
     """get file name from full path"""
     full_path = remove_https(full_path)
@@ -58,6 +69,7 @@ def parse_file_name(full_path: str):
     return path_parts[-1]
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_path(full_path: str):
     """get path from full path (no base url)"""
     full_path = remove_https(full_path)
@@ -67,6 +79,7 @@ def parse_path(full_path: str):
     return f"/{'/'.join(path_parts[1:])}"
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_new_path(full_path: str):
     """get path from full path (no base url, new folder / room removed)"""
     full_path = remove_https(full_path)
@@ -90,6 +103,35 @@ def format_success_message(msg: str):
     return f"{success_txt} {msg}"
 
 
+def handle_dracoon_errors(errors: dict[type, Tuple[str, int]]):
+    """decorator to handle errors of a command coroutine (error type -> (message, exit code))"""
+
+    def decorator(coro):
+        @functools.wraps(coro)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await coro(*args, **kwargs)
+            # stored credentials are removed on session exit
+            except HTTPUnauthorizedError:
+                typer.echo(
+                    format_error_message(
+                        msg="Re-authentication required - please run operation again with new login."
+                    )
+                )
+                sys.exit(1)
+            except tuple(errors) as err:
+                # first matching error type (subclasses must be listed first)
+                msg, exit_code = next(
+                    value for error, value in errors.items() if isinstance(err, error)
+                )
+                typer.echo(format_error_message(msg=msg))
+                sys.exit(exit_code)
+
+        return wrapper
+
+    return decorator
+
+
 async def graceful_exit(dracoon: DRACOON):
     """gracefully close client and revoke access token"""
 
@@ -100,76 +142,122 @@ async def graceful_exit(dracoon: DRACOON):
     await dracoon.logout()
 
 
-def format_and_print_node(
-    node: Node, inode: bool, long_list: bool, readable_size: bool
+@retry(**RETRY_CONFIG)
+async def get_json(dracoon: DRACOON, api_path: str) -> dict:
+    """GET an API path and return decoded JSON (no model validation) - retries like dracoon on 429 / 5xx"""
+    if not await dracoon.client.test_connection() and dracoon.client.connection:
+        await dracoon.client.connect(OAuth2ConnectionType.refresh_token)
+
+    api_url = dracoon.client.base_url + dracoon.client.api_base_url + api_path
+
+    try:
+        res = await dracoon.client.http.get(api_url)
+        res.raise_for_status()
+    except httpx.RequestError as err:
+        await dracoon.client.handle_connection_error(err)
+    except httpx.HTTPStatusError as err:
+        await dracoon.client.handle_http_error(err=err, raise_on_err=True)
+
+    return res.json()
+
+
+async def get_nodes_raw(
+    dracoon: DRACOON, parent_id: int = 0, offset: int = 0, room_manager: bool = False
+) -> dict:
+    """list nodes in a parent as decoded JSON (used in ls)"""
+    return await get_json(
+        dracoon=dracoon,
+        api_path=f"/nodes?offset={offset}&parent_id={parent_id}&room_manager={str(room_manager).lower()}",
+    )
+
+
+# list nodes via path search instead of parent id - off until search order and
+# depth levels are verified against a live DRACOON instance
+LIST_BY_PATH = False
+
+# reserved characters of the search filter syntax (field:operator:value|...)
+NODE_FILTER_RESERVED_CHARS = (":", "|")
+
+# explicit search order to match listing by parent id (type, then name)
+NODE_SEARCH_SORT = "type:asc|name:asc"
+
+
+def can_list_by_path(path: str) -> bool:
+    """check if a parent path can be listed via search filter"""
+    return LIST_BY_PATH and not any(char in path for char in NODE_FILTER_RESERVED_CHARS)
+
+
+async def list_nodes_by_path(dracoon: DRACOON, path: str, offset: int = 0) -> dict:
+    """list all nodes in a parent path as decoded JSON (via search, no parent id required)"""
+    path = path.rstrip("/")
+    # depth level of children (same count as used by get_node_from_path)
+    depth_level = path.count("/") + 1
+    node_filter = urllib.parse.quote(f"parentPath:eq:{path}/")
+    sort = urllib.parse.quote(NODE_SEARCH_SORT)
+
+    return await get_json(
+        dracoon=dracoon,
+        api_path=f"/nodes/search/?search_string=*&offset={offset}&parent_id=0&depth_level={depth_level}&filter={node_filter}&sort={sort}",
+    )
+
+
+# permission flags in ls order (key, flag, suffix)
+NODE_PERMISSION_FLAGS = (
+    ("manage", "m", ""),
+    ("read", "r", ""),
+    ("create", "w", ""),
+    ("change", "c", ""),
+    ("delete", "d", "-"),
+    ("manageDownloadShare", "m", ""),
+    ("manageUploadShare", "m", "-"),
+    ("readRecycleBin", "r", ""),
+    ("restoreRecycleBin", "r", ""),
+    ("deleteRecycleBin", "d", " "),
+)
+
+
+def format_and_print_node_dict(
+    node: dict, inode: bool, long_list: bool, readable_size: bool
 ):
-    """format node string (used in ls)"""
+    """format node string from decoded JSON (used in ls)"""
 
     node_string = ""
     if inode:
-        node_string += f"{node.id} "
+        node_string += f"{node['id']} "
+
+    is_container = node["type"] in (NodeType.room.value, NodeType.folder.value)
 
     if long_list:
-        if node.type == NodeType.folder:
+        if node["type"] == NodeType.folder.value:
             node_string += "d-"
-        elif node.type == NodeType.room:
+        elif node["type"] == NodeType.room.value:
             node_string += "R-"
         else:
             node_string += "--"
 
-        if node.permissions.manage:
-            node_string += "m"
-        else:
-            node_string += "-"
-        if node.permissions.read:
-            node_string += "r"
-        else:
-            node_string += "-"
-        if node.permissions.create:
-            node_string += "w"
-        else:
-            node_string += "-"
-        if node.permissions.change:
-            node_string += "c"
-        else:
-            node_string += "-"
-        if node.permissions.delete:
-            node_string += "d-"
-        else:
-            node_string += "--"
-        if node.permissions.manageDownloadShare:
-            node_string += "m"
-        else:
-            node_string += "-"
-        if node.permissions.manageUploadShare:
-            node_string += "m-"
-        else:
-            node_string += "--"
-        if node.permissions.readRecycleBin:
-            node_string += "r"
-        else:
-            node_string += "-"
-        if node.permissions.restoreRecycleBin:
-            node_string += "r"
-        else:
-            node_string += "-"
-        if node.permissions.deleteRecycleBin:
-            node_string += "d "
-        else:
-            node_string += "- "
+        permissions = node.get("permissions") or {}
+        for key, flag, suffix in NODE_PERMISSION_FLAGS:
+            node_string += (flag if permissions.get(key) else "-") + suffix
 
-        size = node.size
+        size = node.get("size")
 
         if readable_size:
-            size = to_readable_size(node.size)
+            size = to_readable_size(size or 0)
+
+        updated_by = node.get("updatedBy") or {}
+        modified = node.get("timestampModification")
+        if modified:
+            # fromisoformat does not support trailing Z (UTC) before 3.11
+            modified = datetime.fromisoformat(modified.replace("Z", "+00:00"))
+            modified = modified.strftime('%Y %b %d %H:%M')
 
         #pylint: disable=C0301
-        node_string += f"{node.updatedBy.firstName} {node.updatedBy.lastName} {size} {node.timestampModification.strftime('%Y %b %d %H:%M')} "
+        node_string += f"{updated_by.get('firstName')} {updated_by.get('lastName')} {size} {modified} "
 
-    if node.type == NodeType.room or node.type == NodeType.folder:
-        node_string += typer.style(node.name, bold=True)
+    if is_container:
+        node_string += typer.style(node["name"], bold=True)
     else:
-        node_string += f"{node.name}"
+        node_string += f"{node['name']}"
 
     typer.echo(node_string)
 